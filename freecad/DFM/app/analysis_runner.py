@@ -24,12 +24,19 @@ from ..app.analysis_timer import AnalysisTiming
 ProgressCallback = Optional[Callable[[int, int, str], None]]
 AbortCallback = Optional[Callable[[], bool]]
 
+# Fallback pull direction; constructing a gp_Dir allocates an OCC object, so
+# the default is built once instead of per run.
+_DEFAULT_PULL_DIRECTION = gp_Dir(0, 0, 1)
+
 
 class AnalysisRunner:
     """Orchestrates DFM analysis by running analyzers and checks for a given process and material."""
 
     def __init__(self):
         self.analyzer_cache: dict[str, Any] = {}
+        # Analyzer instances are stateless between runs (execute() resets all
+        # per-run attributes), so they are created once and reused.
+        self._analyzer_instances: dict[str, Any] = {}
 
     def run_analysis(
         self,
@@ -55,9 +62,11 @@ class AnalysisRunner:
             return []
 
         shape_occ: TopoDS_Shape = freecad_to_ocp(shape)
-        pull_direction = kwargs.get(ProcessRequirement.PULL_DIRECTION.name, gp_Dir(0, 0, 1))
+        pull_direction = kwargs.get(ProcessRequirement.PULL_DIRECTION.name)
+        if pull_direction is None:
+            pull_direction = _DEFAULT_PULL_DIRECTION
         num_faces = len(shape.Faces)
-        active_rules, total_steps = self._calculate_total_steps(process, num_faces)
+        active_checks, total_steps = self._calculate_total_steps(process, num_faces)
 
         self.face_index = FaceIndex(shape_occ)
         self.edge_index = EdgeIndex(shape_occ)
@@ -71,15 +80,10 @@ class AnalysisRunner:
         results: list[CheckResult] = []
         current_step = 0
 
-        for rule_id in active_rules:
+        for rule_id, check_instance in active_checks:
             if check_abort and check_abort():
                 break
 
-            check_class = get_check_class(rule_id)
-            if not check_class:
-                continue
-
-            check_instance = check_class()
             analyzer_id = check_instance.required_analyzer_id
 
             if analyzer_id not in self.analyzer_cache:
@@ -141,18 +145,22 @@ class AnalysisRunner:
         return {key: value for _, key, value in contents}
 
     def _calculate_total_steps(self, process: Any, num_faces: int) -> tuple[list, int]:
-        """Return the ordered list of active rule IDs and the total progress step count."""
-        active_rules = []
+        """Return the ordered (rule ID, check instance) pairs and the total step count.
+
+        The check instances are resolved here once and reused by the main
+        loop, instead of instantiating each check a second time."""
+        active_checks = []
         unique_analyzers = set()
 
         for rule_id in process.active_rules:
             check_class = get_check_class(rule_id)
             if check_class:
-                unique_analyzers.add(check_class().required_analyzer_id)
-                active_rules.append(rule_id)
+                check_instance = check_class()
+                unique_analyzers.add(check_instance.required_analyzer_id)
+                active_checks.append((rule_id, check_instance))
 
-        total_steps = (len(unique_analyzers) * num_faces) + len(active_rules)
-        return active_rules, total_steps
+        total_steps = (len(unique_analyzers) * num_faces) + len(active_checks)
+        return active_checks, total_steps
 
     def _resolve_rule_config(self, process: Any, target_material: Any, rule_id: Any) -> RuleLimit:
         """Build a RuleLimit by layering the Default material config with any material override."""
@@ -191,12 +199,13 @@ class AnalysisRunner:
         check_abort: AbortCallback,
         **kwargs: Any,
     ) -> bool:
-        """Instantiate and execute an analyzer, storing its result in the cache."""
-        analyzer_class = get_analyzer_class(analyzer_id)
-        if not analyzer_class:
-            return False
-
-        analyzer_instance = analyzer_class()
+        """Execute an analyzer, storing its result in the cache."""
+        analyzer_instance = self._analyzer_instances.get(analyzer_id)
+        if analyzer_instance is None:
+            analyzer_class = get_analyzer_class(analyzer_id)
+            if not analyzer_class:
+                return False
+            analyzer_instance = self._analyzer_instances[analyzer_id] = analyzer_class()
 
         def on_progress(faces_done: int):
             if progress_cb:
@@ -38,26 +38,30 @@ class AnalysisTiming:
     def report(self) -> None:
         sep = "─" * 60
 
-        print(f"\n{'═' * 60}\n  DFM Analysis Timing Report\n{'═' * 60}\n")
+        # The report is assembled in memory and emitted with one print, so
+        # FreeCAD's Report View receives a single write instead of one per row.
+        lines = [f"\n{'═' * 60}\n  DFM Analysis Timing Report\n{'═' * 60}\n"]
 
         if self._analyzer_times:
-            print(f"  Analyzers\n  {sep}\n")
+            lines.append(f"  Analyzers\n  {sep}\n")
             for name, t in self._analyzer_times.items():
-                print(f"  {name:<40} {self._fmt(t):>10}\n")
+                lines.append(f"  {name:<40} {self._fmt(t):>10}\n")
 
         if self._check_times:
-            print(f"\n  Checks\n  {sep}\n")
+            lines.append(f"\n  Checks\n  {sep}\n")
             for name, t in self._check_times.items():
-                print(f"  {name:<40} {self._fmt(t):>10}\n")
+                lines.append(f"  {name:<40} {self._fmt(t):>10}\n")
 
         analyzer_total = sum(self._analyzer_times.values())
         check_total = sum(self._check_times.values())
 
-        print(f"\n  {sep}\n")
-        print(f"  {'Analyzers subtotal':<40} {self._fmt(analyzer_total):>10}\n")
-        print(f"  {'Checks subtotal':<40} {self._fmt(check_total):>10}\n")
-        print(f"  {'Total':<40} {self._fmt(self._total_elapsed):>10}\n")
-        print(f"{'═' * 60}\n\n")
+        lines.append(f"\n  {sep}\n")
+        lines.append(f"  {'Analyzers subtotal':<40} {self._fmt(analyzer_total):>10}\n")
+        lines.append(f"  {'Checks subtotal':<40} {self._fmt(check_total):>10}\n")
+        lines.append(f"  {'Total':<40} {self._fmt(self._total_elapsed):>10}\n")
+        lines.append(f"{'═' * 60}\n\n")
+
+        print("\n".join(lines))
 
     @staticmethod
     def _fmt(seconds: float) -> str:
@@ -12,7 +12,7 @@ from pathlib import Path
 from typing import Optional
 
 from ..core.models import CheckResult, GeometryRef, Severity
-from ..core.rules import Rulebook
+from ..core.rules import Rulebook, RULEBOOK_BY_ID
 
 
 @dataclass
@@ -183,7 +183,7 @@ class HistoryManager:
     @staticmethod
     def _result_from_dict(d: dict) -> CheckResult:
         return CheckResult(
-            rule_id=Rulebook[d["rule"]],
+            rule_id=RULEBOOK_BY_ID[d["rule"]],
             severity=Severity[d["severity"]],
             overview=d.get("overview", ""),
             message=d.get("message", ""),
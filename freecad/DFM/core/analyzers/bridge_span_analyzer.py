@@ -27,6 +27,10 @@ from ...core.utils.geometry import (
     project_onto,
 )
 
+# Built once: the analyzer only reads the fallback orientation, and gp_Dir
+# construction goes through an OCC allocation.
+_DEFAULT_PRINT_ORIENTATION = gp_Dir(0, 0, 1)
+
 
 @register_analyzer("BRIDGE_SPAN_ANALYZER")
 class BridgeSpanAnalyzer(BaseAnalyzer):
@@ -75,7 +79,7 @@ class BridgeSpanAnalyzer(BaseAnalyzer):
         self.resolve_prefs(kwargs.get("prefs", {}))
 
         self.print_orientation = kwargs.get(
-            ProcessRequirement.PRINT_ORIENTATION.name, gp_Dir(0, 0, 1)
+            ProcessRequirement.PRINT_ORIENTATION.name, _DEFAULT_PRINT_ORIENTATION
         )
         self.bed_height = calculate_bed_height(shape, self.print_orientation)
         self.solid_classifier = BRepClass3d_SolidClassifier(shape)
@@ -5,6 +5,8 @@
 import math
 from typing import Any, Callable, Optional
 
+import numpy as np
+
 import FreeCAD  # type: ignore
 
 from OCP.TopoDS import TopoDS_Shape, TopoDS_Face, TopoDS
@@ -27,6 +29,10 @@ from ...core.utils.geometry import (
 )
 from ...core.utils.mold import MoldSide, moldside_of_face
 
+# Built once: the analyzer only reads the fallback direction, and gp_Dir
+# construction goes through an OCC allocation.
+_DEFAULT_PULL_DIRECTION = gp_Dir(0, 0, 1)
+
 
 @register_analyzer("DRAFT_ANALYZER")
 class DraftAnalyzer(BaseAnalyzer):
@@ -60,7 +66,9 @@ class DraftAnalyzer(BaseAnalyzer):
         **kwargs,
     ):
         """Runs a full draft analysis on an inputted shape."""
-        self.pull_direction = kwargs.get(ProcessRequirement.PULL_DIRECTION.name, gp_Dir(0, 0, 1))
+        self.pull_direction = kwargs.get(
+            ProcessRequirement.PULL_DIRECTION.name, _DEFAULT_PULL_DIRECTION
+        )
         self.samples = kwargs.get("samples", 20)
 
         self.face_index = face_index
@@ -93,24 +101,34 @@ class DraftAnalyzer(BaseAnalyzer):
         Estimates the minimum draft angle (degrees) by sampling the surface normal across a UV grid.
         Returns the most critical (smallest) value found.
         """
-        min_draft_angle = float("inf")
-
+        normals = []
         for u, v in yield_face_uv_grid(face, self.samples, margin=0.01):
             normal_dir = get_face_uv_normal(face, u, v)
             if not normal_dir:
                 FreeCAD.Console.PrintError(f"Normal returned None for face {face.__hash__()}")
                 continue
+            normals.append((normal_dir.X(), normal_dir.Y(), normal_dir.Z()))
+
+        if not normals:
+            return float("inf")
+
+        # One vectorized pass over all sampled normals instead of a per-sample
+        # gp_Dir.Angle call. abs_tol matches get_draft_for_dir's isclose checks.
+        pull = self.pull_direction
+        dots = np.asarray(normals) @ np.array((pull.X(), pull.Y(), pull.Z()))
+        angles = np.degrees(np.arccos(np.clip(dots, -1.0, 1.0)))
+        draft_angles = np.where(
+            np.abs(angles) < 1e-5,
+            90.0,
+            np.where(np.abs(angles - 180.0) < 1e-5, -90.0, angles - 90.0),
+        )
 
-            draft_angle = self.get_draft_for_dir(normal_dir)
-
-            # Check if face belongs to the core, and flip the sign if True
-            moldside = self.core_cavity_mapping[self.face_index.index_of(face)]
-            if moldside == MoldSide.CORE:
-                draft_angle = -draft_angle
-
-            min_draft_angle = min(min_draft_angle, draft_angle)
+        # Check if face belongs to the core, and flip the sign if True
+        moldside = self.core_cavity_mapping[self.face_index.index_of(face)]
+        if moldside == MoldSide.CORE:
+            draft_angles = -draft_angles
 
-        return min_draft_angle
+        return float(draft_angles.min())
 
     def get_draft_for_plane(self, face: TopoDS_Face) -> float:
         """
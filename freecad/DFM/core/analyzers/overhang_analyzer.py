@@ -24,6 +24,10 @@ from ...core.utils.geometry import (
     yield_face_uv_grid,
 )
 
+# Built once: the analyzer only reads the fallback orientation, and gp_Dir
+# construction goes through an OCC allocation.
+_DEFAULT_PRINT_ORIENTATION = gp_Dir(0, 0, 1)
+
 
 @register_analyzer("OVERHANG_ANALYZER")
 class OverhangAnalyzer(BaseAnalyzer):
@@ -56,7 +60,7 @@ class OverhangAnalyzer(BaseAnalyzer):
         **kwargs: Any,
     ) -> dict[tuple[str, int], float]:
         self.print_orientation = kwargs.get(
-            ProcessRequirement.PRINT_ORIENTATION.name, gp_Dir(0, 0, 1)
+            ProcessRequirement.PRINT_ORIENTATION.name, _DEFAULT_PRINT_ORIENTATION
         )
         self.samples = kwargs.get("samples", 15)
         self.face_index = face_index
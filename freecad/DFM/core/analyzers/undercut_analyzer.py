@@ -14,6 +14,10 @@ from ...core.models import ProcessRequirement
 from ...core.utils import yield_face_uv_grid, get_face_uv_normal, get_point_from_uv
 from ...core.registries import register_analyzer
 
+# Built once: the analyzer only reads the fallback direction, and gp_Dir
+# construction goes through an OCC allocation.
+_DEFAULT_PULL_DIRECTION = gp_Dir(0, 0, 1)
+
 
 @register_analyzer("UNDERCUT_ANALYZER")
 class UndercutAnalyzer(BaseAnalyzer):
@@ -41,7 +45,9 @@ class UndercutAnalyzer(BaseAnalyzer):
         check_abort: Optional[Callable[[], bool]] = None,
         **kwargs: Any,
     ) -> dict[tuple[str, int], list[float]]:
-        self.pull_direction = kwargs.get(ProcessRequirement.PULL_DIRECTION.name, gp_Dir(0, 0, 1))
+        self.pull_direction = kwargs.get(
+            ProcessRequirement.PULL_DIRECTION.name, _DEFAULT_PULL_DIRECTION
+        )
         self.samples = kwargs.get("samples", 10)
 
         self.intersector = IntCurvesFace_ShapeIntersector()
@@ -3,7 +3,6 @@
 # SPDX-FileNotice: Part of the DFM addon.
 
 from dataclasses import dataclass, field
-from typing import Any
 from .rules import Rulebook
 
 from enum import Enum, auto
@@ -49,10 +48,19 @@ class CheckResult:
     comparison: str = ""
     unit: str = ""
 
-    failing_geometry: list[Any] = field(default_factory=list)
+    # ("Face"|"Edge", 1-based index) keys from the analyzers; resolved into
+    # GeometryRefs after analysis. Never TopoDS wrappers.
+    failing_geometry: list[tuple[str, int]] = field(default_factory=list)
 
     refs: list[GeometryRef] = field(default_factory=list)
 
+    # Cached severity.value: the report model sorts on this rank for every
+    # finding, and an int attribute beats an enum attribute chain there.
+    severity_rank: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.severity_rank = self.severity.value
+
     @property
     def is_resolved(self) -> bool:
         return len(self.refs) > 0
@@ -5,7 +5,7 @@
 from dataclasses import dataclass, field, fields
 from typing import Optional
 
-from ...core.rules import Criticality, Rulebook
+from ...core.rules import Criticality, Rulebook, RULEBOOK_BY_ID
 
 
 @dataclass
@@ -49,7 +49,7 @@ class Material:
         parsed_limits = {}
         for rule_id, limit_data in raw_limits.items():
             try:
-                rule_member = Rulebook[rule_id]
+                rule_member = RULEBOOK_BY_ID[rule_id]
                 parsed_limits[rule_member] = RuleLimit.from_dict(limit_data)
             except KeyError:
                 print(f"Warning: Rule ID '{rule_id}' not found in Rulebook. Skipping.")
@@ -82,7 +82,7 @@ class Process:
         active_rules = []
         for r_id in raw_active_rules:
             try:
-                active_rules.append(Rulebook[r_id])
+                active_rules.append(RULEBOOK_BY_ID[r_id])
             except KeyError:
                 print(f"Warning: Rule '{r_id}' in process '{data.get('name')}' is invalid.")
 
@@ -90,13 +90,13 @@ class Process:
 
         for r_id, f_data in raw_feedback.items():
             try:
-                process.rule_feedback[Rulebook[r_id]] = RuleFeedback(**f_data)
+                process.rule_feedback[RULEBOOK_BY_ID[r_id]] = RuleFeedback(**f_data)
             except (KeyError, TypeError) as e:
                 print(f"Warning: Could not parse feedback for '{r_id}': {e}")
 
         for r_id, crit_name in raw_criticality.items():
             try:
-                process.rule_criticality[Rulebook[r_id]] = Criticality[crit_name.upper()]
+                process.rule_criticality[RULEBOOK_BY_ID[r_id]] = Criticality[crit_name.upper()]
             except KeyError:
                 print(f"Warning: Invalid criticality '{crit_name}' for rule '{r_id}'.")
 
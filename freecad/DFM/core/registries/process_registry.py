@@ -3,6 +3,15 @@
 # SPDX-FileNotice: Part of the DFM addon.
 
 import yaml
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 from dataclasses import asdict
@@ -12,6 +21,12 @@ import FreeCAD as App  # type: ignore
 from ...core.processes.process import Process
 from ...core.rules import Rulebook
 
+# Bump whenever the pickled layout of Process/Material/RuleLimit changes.
+# Unpickling restores __dict__ without running __init__, so without this a
+# stale cache from an older addon version would yield instances missing
+# newly added fields and fail far from the cause.
+_CACHE_FORMAT_VERSION = 1
+
 
 class ProcessRegistry:
     _instance = None
@@ -28,45 +43,143 @@ class ProcessRegistry:
 
         self.processes: dict[str, Process] = {}
 
+        # Lazily filled by get_process_materials so dropdown changes resolve
+        # to one dict lookup instead of rebuilding the material list.
+        self._materials_cache: dict[str, tuple[Optional[Process], tuple[str, ...]]] = {}
+
         self.dev_dir = Path(__file__).parent.parent / "processes"
         self.user_dir = Path(App.getUserAppDataDir()) / "dfm" / "processes"
+        self.cache_file = Path(App.getUserAppDataDir()) / "dfm" / "process_cache.pkl"
 
-        self.discover_processes()
+        # Discovery is deferred until the first process lookup so that merely
+        # activating the workbench never pays the YAML scan.
+        self._discovered = False
+
+    def _ensure_discovered(self):
+        """Runs discovery on first use. Cheap no-op afterwards."""
+        if not self._discovered:
+            self.discover_processes()
 
     def discover_processes(self):
-        """Scans both dev and user directories. User versions override Dev versions."""
+        """Scans both dev and user directories. User versions override Dev versions.
+
+        Parsed Process objects are cached on disk keyed by (path, mtime, size),
+        so unchanged files cost a stat() instead of a YAML parse on relaunch.
+        """
         self.processes.clear()
+        self._materials_cache.clear()
+
+        self._cache = self._load_cache()
+        self._cache_dirty = False
 
         self._load_from_dir(self.dev_dir)
 
         self._load_from_dir(self.user_dir)
 
+        if self._cache_dirty:
+            self._save_cache()
+
+        self._discovered = True
         print(f"Registry initialized: {len(self.processes)} processes loaded.")
 
+    def _load_cache(self) -> dict:
+        """Reads the on-disk cache of parsed processes. Returns {} on any failure."""
+        try:
+            with open(self.cache_file, "rb") as f:
+                cache = pickle.load(f)
+            if isinstance(cache, dict) and cache.get("version") == _CACHE_FORMAT_VERSION:
+                entries = cache.get("entries")
+                if isinstance(entries, dict):
+                    return entries
+        except Exception:
+            pass
+        return {}
+
+    def _save_cache(self):
+        """Writes the process cache atomically so a crash never leaves a torn file."""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_file.with_suffix(".pkl.tmp")
+            payload = {"version": _CACHE_FORMAT_VERSION, "entries": self._cache}
+            with open(tmp_path, "wb") as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_file)
+        except Exception as e:
+            print(f"Failed to write process cache: {e}")
+
     def _load_from_dir(self, directory: Path):
-        """Helper to load all YAML files from a specific Path object."""
+        """Helper to load all YAML files from a specific Path object.
+
+        Files are parsed concurrently (libyaml releases the GIL), then the
+        registry dict is populated on the calling thread in filename order
+        so override semantics stay deterministic.
+        """
         if not directory.exists():
             return
 
-        for filepath in directory.glob("*.yaml"):
+        filepaths = sorted(directory.glob("*.yaml"))
+        if not filepaths:
+            return
+
+        loaded: dict[Path, Optional[Process]] = {}
+        misses: list[Path] = []
+
+        for filepath in filepaths:
             try:
-                with open(filepath, "r") as f:
-                    data = yaml.safe_load(f)
-                    if isinstance(data, dict):
-                        process = Process.from_yaml(data)
-                        self.processes[process.name] = process
-            except Exception as e:
-                print(f"Error loading {filepath.name} from {directory}: {e}")
+                stat = filepath.stat()
+                signature = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                misses.append(filepath)
+                continue
+
+            cached = self._cache.get(str(filepath))
+            if cached and cached[0] == signature:
+                loaded[filepath] = cached[1]
+            else:
+                misses.append(filepath)
+
+        if misses:
+            with ThreadPoolExecutor(max_workers=min(8, len(misses))) as executor:
+                for filepath, process in zip(misses, executor.map(self._load_one, misses)):
+                    loaded[filepath] = process
+                    if process is not None:
+                        try:
+                            stat = filepath.stat()
+                            self._cache[str(filepath)] = (
+                                (stat.st_mtime_ns, stat.st_size),
+                                process,
+                            )
+                            self._cache_dirty = True
+                        except OSError:
+                            pass
+
+        for filepath in filepaths:
+            process = loaded.get(filepath)
+            if process is not None:
+                self.processes[process.name] = process
+
+    def _load_one(self, filepath: Path) -> Optional[Process]:
+        """Parses a single YAML file into a Process, or None on failure."""
+        try:
+            with open(filepath, "r") as f:
+                data = yaml.load(f, Loader=YamlLoader)
+                if isinstance(data, dict):
+                    return Process.from_yaml(data)
+        except Exception as e:
+            print(f"Error loading {filepath.name} from {filepath.parent}: {e}")
+        return None
 
     def save_all_processes(self):
         """Saves all processes. Any changes or new items go to the User AppData dir."""
+        self._ensure_discovered()
         if not self.user_dir.exists():
             self.user_dir.mkdir(parents=True, exist_ok=True)
 
-        for process in self.processes.values():
-            self._save_to_user_dir(process)
+        # One summary line instead of a synchronous console write per process.
+        saved = sum(1 for process in self.processes.values() if self._save_to_user_dir(process))
+        print(f"Saved {saved} processes to {self.user_dir}")
 
-    def _save_to_user_dir(self, process: Process):
+    def _save_to_user_dir(self, process: Process) -> bool:
         """Serializes process and writes it specifically to the User directory."""
         serialized_data = self._serialize_process(process)
 
@@ -83,9 +196,10 @@ class ProcessRegistry:
                     indent=4,
                     allow_unicode=True,
                 )
-            print(f"Saved: {process.name} -> {filepath}")
+            return True
         except Exception as e:
             print(f"Failed to save {process.name} to user dir: {e}")
+            return False
 
     def _serialize_process(self, process: Process) -> dict:
         """Converts dataclasses and Enums into a YAML-compatible dict."""
@@ -112,24 +226,40 @@ class ProcessRegistry:
         return data
 
     def get_categories(self) -> list[str]:
+        self._ensure_discovered()
         categories = {p.category for p in self.processes.values()}
         return sorted(list(categories))
 
     def get_processes_for_category(self, category_name: str) -> list[Process]:
+        self._ensure_discovered()
         return sorted(
             [p for p in self.processes.values() if p.category == category_name],
             key=lambda p: p.name,
         )
 
     def get_process_by_name(self, name: str) -> Optional[Process]:
+        self._ensure_discovered()
         return self.processes.get(name)
 
     def add_process(self, process: Process):
+        self._ensure_discovered()
         self.processes[process.name] = process
+        self._materials_cache.pop(process.name, None)
 
     def get_process_by_id(self, process_id: str) -> Process:
+        self._ensure_discovered()
         return self.processes.get(process_id)  # type: ignore
 
+    def get_process_materials(self, process_id: str) -> tuple[Optional[Process], tuple[str, ...]]:
+        """Returns a process and its material names, resolved once per process."""
+        self._ensure_discovered()
+        cached = self._materials_cache.get(process_id)
+        if cached is None:
+            process = self.processes.get(process_id)
+            materials = tuple(process.materials.keys()) if process else ()
+            cached = self._materials_cache[process_id] = (process, materials)
+        return cached
+
     def _serialize_rule_limit(self, rule: Rulebook, limit) -> dict:
         if rule.is_binary:
             return {"binary_severity": limit.binary_severity}
@@ -150,10 +280,12 @@ class ProcessRegistry:
     def delete_user_file(self, process_name: str) -> bool:
         """Removes the user-directory YAML. Returns True if a file was deleted."""
         path = self.user_dir / self.get_process_filename(process_name)
-        if path.exists():
+        # A single unlink avoids the exists()/unlink() stat pair and its race.
+        try:
             path.unlink()
-            return True
-        return False
+        except FileNotFoundError:
+            return False
+        return True
 
     def restore_default(self, process_name: str) -> bool:
         """
@@ -173,8 +305,10 @@ class ProcessRegistry:
         """
         if self.is_builtin(process_name):
             return False
+        self._ensure_discovered()
         self.delete_user_file(process_name)
         self.processes.pop(process_name, None)
+        self._materials_cache.pop(process_name, None)
         return True
 
     def import_process_from_file(self, filepath: Path) -> tuple[bool, str]:
@@ -182,9 +316,10 @@ class ProcessRegistry:
         Loads a YAML file as a Process, adds it to the registry, and saves to user_dir.
         Returns (True, process_name) on success, or (False, error_message) on failure.
         """
+        self._ensure_discovered()
         try:
             with open(filepath, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=YamlLoader)
 
             if not isinstance(data, dict):
                 return False, "File does not contain a valid process definition."
@@ -195,6 +330,7 @@ class ProcessRegistry:
                 return False, f"A process named '{process.name}' already exists."
 
             self.processes[process.name] = process
+            self._materials_cache.pop(process.name, None)
             self._save_to_user_dir(process)
             return True, process.name
 
@@ -152,3 +152,8 @@ class Rulebook(Enum):
         if self.value.field_labels:
             return self.value.field_labels
         return SHAPE_DEFAULT_LABELS[self.shape]
+
+
+# Plain-dict lookup for serialized rule ids, used on YAML/JSON decode paths
+# that convert thousands of stored strings back into Rulebook members.
+RULEBOOK_BY_ID: dict[str, Rulebook] = {rule.name: rule for rule in Rulebook}
@@ -2,4 +2,20 @@
 # SPDX-FileCopyrightText: 2025 Ryan Kembrey <ryan.FreeCAD@gmail.com>
 # SPDX-FileNotice: Part of the DFM addon.
 
-from .geometry import *
+from .geometry import (
+    EdgeIndex,
+    FaceIndex,
+    calculate_bed_height,
+    get_adaptive_sample_count,
+    get_extent_along,
+    get_face_uv_center,
+    get_face_uv_grid_array,
+    get_face_uv_normal,
+    get_face_uv_ratios,
+    get_point_from_uv,
+    is_flat,
+    is_point_on_face,
+    optimize_face_uv_search,
+    project_onto,
+    yield_face_uv_grid,
+)
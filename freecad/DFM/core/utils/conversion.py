@@ -11,13 +11,41 @@ from OCP.BRep import BRep_Builder
 from OCP.BRepTools import BRepTools
 
 
+# Converted shapes are memoized so repeat runs on the same model skip the
+# BRep round-trip. Entries hold a strong ref to the source shape, which keeps
+# the id() key valid; hashCode guards against a mutated shape slipping through.
+_CONVERSION_CACHE: dict[int, tuple[Part.Shape, int, TopoDS_Shape]] = {}
+_CONVERSION_CACHE_MAX = 4
+
+
+def _remove_quietly(path: str) -> None:
+    """Removes a temp file without the exists()/remove() stat pair."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
 def freecad_to_ocp(fc_shape: Part.Shape) -> TopoDS_Shape:
     """
     Converts a FreeCAD Part.Shape to an OCP TopoDS_Shape via a temporary file.
+
+    Results are cached per source shape, so re-running an analysis on the
+    same model does not export the BRep again.
     """
     if fc_shape is None or fc_shape.isNull():
         raise ValueError("Cannot convert an empty or Null FreeCAD shape.")
 
+    try:
+        shape_hash = fc_shape.hashCode()
+    except AttributeError:
+        shape_hash = None
+
+    if shape_hash is not None:
+        cached = _CONVERSION_CACHE.get(id(fc_shape))
+        if cached is not None and cached[1] == shape_hash:
+            return cached[2]
+
     fd, temp_path = tempfile.mkstemp(suffix=".brep")
 
     try:
@@ -31,9 +59,38 @@ def freecad_to_ocp(fc_shape: Part.Shape) -> TopoDS_Shape:
         if ocp_shape.IsNull():
             raise ValueError("OCP failed to load the BRep file.")
 
+        if shape_hash is not None:
+            if len(_CONVERSION_CACHE) >= _CONVERSION_CACHE_MAX:
+                _CONVERSION_CACHE.clear()
+            _CONVERSION_CACHE[id(fc_shape)] = (fc_shape, shape_hash, ocp_shape)
+
         return ocp_shape
 
     finally:
         os.close(fd)
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
+        _remove_quietly(temp_path)
+
+
+def ocp_to_freecad(ocp_shape: TopoDS_Shape) -> Part.Shape:
+    """
+    Converts an OCP TopoDS_Shape to a FreeCAD Part.Shape via a temporary file.
+    """
+    if ocp_shape is None or ocp_shape.IsNull():
+        raise ValueError("Cannot convert an empty or Null OCP shape.")
+
+    fd, temp_path = tempfile.mkstemp(suffix=".brep")
+
+    try:
+        BRepTools.Write_s(ocp_shape, temp_path)
+
+        fc_shape = Part.Shape()
+        fc_shape.importBrep(temp_path)
+
+        if fc_shape.isNull():
+            raise ValueError("FreeCAD failed to load the BRep file.")
+
+        return fc_shape
+
+    finally:
+        os.close(fd)
+        _remove_quietly(temp_path)
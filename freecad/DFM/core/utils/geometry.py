@@ -4,6 +4,8 @@
 
 from typing import Generator, Optional, Callable
 
+import numpy as np
+
 from OCP.BRepTools import BRepTools
 from OCP.BRep import BRep_Tool
 from OCP.BRepBndLib import BRepBndLib
@@ -77,21 +79,43 @@ def get_face_uv_center(face: TopoDS_Face) -> tuple[float, float]:
     return (u_mid, v_mid)
 
 
+# Per-face surface properties are expensive OCC constructions; analyzers query
+# the same face for hundreds of grid samples, so memoize them. Keys are the
+# face wrappers themselves (identity hash), kept alive by the cache entry.
+_SLPROPS_CACHE: dict[TopoDS_Face, tuple] = {}
+_SLPROPS_CACHE_MAX = 256
+
+
+def _face_normal_props(face: TopoDS_Face) -> tuple:
+    """Returns cached (props, transformation-or-None, is_reversed) for a face."""
+    entry = _SLPROPS_CACHE.get(face)
+    if entry is None:
+        surface = BRep_Tool.Surface_s(face)
+        props = GeomLProp_SLProps(surface, 1, 1e-6)
+        location = face.Location()
+        trsf = None if location.IsIdentity() else location.Transformation()
+        reversed_ = face.Orientation() == TopAbs_REVERSED
+
+        if len(_SLPROPS_CACHE) >= _SLPROPS_CACHE_MAX:
+            _SLPROPS_CACHE.clear()
+        entry = (props, trsf, reversed_)
+        _SLPROPS_CACHE[face] = entry
+    return entry
+
+
 def get_face_uv_normal(face: TopoDS_Face, u: float, v: float) -> Optional[gp_Dir]:
     """Returns the normal of a TopoDS_Face at UV"""
 
-    surface = BRep_Tool.Surface_s(face)
-    props = GeomLProp_SLProps(surface, u, v, 1, 1e-6)
+    props, trsf, reversed_ = _face_normal_props(face)
+    props.SetParameters(u, v)
 
     if props.IsNormalDefined():
-        pnt = props.Value()
         norm = props.Normal()
 
-        if not face.Location().IsIdentity():
-            pnt.Transform(face.Location().Transformation())
-            norm.Transform(face.Location().Transformation())
+        if trsf is not None:
+            norm.Transform(trsf)
 
-        if face.Orientation() == TopAbs_REVERSED:
+        if reversed_:
             norm.Reverse()
 
         return norm
@@ -118,19 +142,19 @@ def get_adaptive_sample_count(face: TopoDS_Face, min_samples: int, max_samples:
     return int(max(min_samples, min(max_samples, 2 + (props.Mass() ** 0.5) / 10)))
 
 
-def yield_face_uv_grid(
-    face: TopoDS_Face, samples: int, margin: float = 0.00
-) -> Generator[tuple[float, float], None, None]:
+def get_face_uv_grid_array(face: TopoDS_Face, samples: int, margin: float = 0.00) -> np.ndarray:
     """
-    Generates (u, v) coordinates for a grid covering the face.
+    Returns an (N, 2) float64 array of (u, v) grid coordinates covering the face.
+
+    Points are not classified against the face boundary; callers that only want
+    interior points should filter with is_point_on_face (or use
+    yield_face_uv_grid, which does this).
 
     Args:
         face: The face to sample.
         samples: Number of points along each axis.
         margin: Percentage (0.0 to 0.5) to crop from edges to avoid corner noise.
     """
-    classifier = BRepTopAdaptor_FClass2d(face, 1e-6)
-
     u_min, u_max, v_min, v_max = BRepTools.UVBounds_s(face)
 
     # Apply margin (Default to none)
@@ -144,20 +168,30 @@ def yield_face_uv_grid(
 
     # Handle single point (center)
     if samples <= 1:
-        yield (s_u_min + s_u_max) / 2.0, (s_v_min + s_v_max) / 2.0
-        return
-
-    # Calculate step
-    u_step = (s_u_max - s_u_min) / (samples - 1)
-    v_step = (s_v_max - s_v_min) / (samples - 1)
-
-    # Iterate
-    for i in range(samples):
-        u = s_u_min + i * u_step
-        for j in range(samples):
-            v = s_v_min + j * v_step
-            if is_point_on_face(u, v, face, classifier):
-                yield u, v
+        return np.array([[(s_u_min + s_u_max) / 2.0, (s_v_min + s_v_max) / 2.0]])
+
+    u = np.linspace(s_u_min, s_u_max, samples)
+    v = np.linspace(s_v_min, s_v_max, samples)
+    return np.stack(np.meshgrid(u, v, indexing="ij"), axis=-1).reshape(-1, 2)
+
+
+def yield_face_uv_grid(
+    face: TopoDS_Face, samples: int, margin: float = 0.00
+) -> Generator[tuple[float, float], None, None]:
+    """
+    Generates (u, v) coordinates for a grid covering the face, skipping points
+    that fall outside the face boundary.
+
+    Args:
+        face: The face to sample.
+        samples: Number of points along each axis.
+        margin: Percentage (0.0 to 0.5) to crop from edges to avoid corner noise.
+    """
+    classifier = BRepTopAdaptor_FClass2d(face, 1e-6)
+
+    for u, v in get_face_uv_grid_array(face, samples, margin).tolist():
+        if is_point_on_face(u, v, face, classifier):
+            yield u, v
 
 
 def get_point_from_uv(
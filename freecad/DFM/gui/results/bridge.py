@@ -30,23 +30,35 @@ class DFMViewProvider:
 
     def __init__(self, target_object):
         self.target_object = target_object
+        # Each access to obj.Shape.Faces rebuilds the full wrapper list; the
+        # shape is static for the lifetime of a results session, so snapshot
+        # the sub-element lists once.
+        self._shape = target_object.Shape
+        self._shape_faces = self._shape.Faces
+        self._shape_edges = self._shape.Edges
         self.anno = DFMAnnotation()
         self._cam_animator = CameraAnimator()
         self._highlighted_faces: list[str] = []
         self._highlighted_edges: list[str] = []
         self._original_transparency: int = target_object.ViewObject.Transparency
 
+    @staticmethod
+    def _merge_color_pairs(index_color_pairs: list[tuple[int, str]]) -> dict[int, str]:
+        """Collapses (index, color) pairs into one color per index, errors winning."""
+        index_color_map: dict[int, str] = {}
+        for idx, hex_col in index_color_pairs:
+            existing = index_color_map.get(idx)
+            if existing is None or hex_col == "#E24B4A":
+                index_color_map[idx] = hex_col
+        return index_color_map
+
     def highlight_faces_by_index(self, index_color_pairs: list[tuple[int, str]]):
         """Highlights faces by their 0-based index. Clears any previous highlights."""
         self.anno.remove(App.ActiveDocument)
         Gui.Selection.clearSelection()
         self._highlighted_edges = []
 
-        index_color_map: dict[int, str] = {}
-        for idx, hex_col in index_color_pairs:
-            existing = index_color_map.get(idx)
-            if existing is None or hex_col == "#E24B4A":
-                index_color_map[idx] = hex_col
+        index_color_map = self._merge_color_pairs(index_color_pairs)
 
         self._highlighted_faces = [f"Face{i + 1}" for i in index_color_map]
 
@@ -65,11 +77,7 @@ class DFMViewProvider:
         Gui.Selection.clearSelection()
         self._highlighted_faces = []
 
-        index_color_map: dict[int, str] = {}
-        for idx, hex_col in index_color_pairs:
-            existing = index_color_map.get(idx)
-            if existing is None or hex_col == "#E24B4A":
-                index_color_map[idx] = hex_col
+        index_color_map = self._merge_color_pairs(index_color_pairs)
 
         self._highlighted_edges = [f"Edge{i + 1}" for i in index_color_map]
 
@@ -91,17 +99,8 @@ class DFMViewProvider:
         self.anno.remove(App.ActiveDocument)
         Gui.Selection.clearSelection()
 
-        face_color_map: dict[int, str] = {}
-        for idx, hex_col in face_color_pairs:
-            existing = face_color_map.get(idx)
-            if existing is None or hex_col == "#E24B4A":
-                face_color_map[idx] = hex_col
-
-        edge_color_map: dict[int, str] = {}
-        for idx, hex_col in edge_color_pairs:
-            existing = edge_color_map.get(idx)
-            if existing is None or hex_col == "#E24B4A":
-                edge_color_map[idx] = hex_col
+        face_color_map = self._merge_color_pairs(face_color_pairs)
+        edge_color_map = self._merge_color_pairs(edge_color_pairs)
 
         self._highlighted_faces = [f"Face{i + 1}" for i in face_color_map]
         self._highlighted_edges = [f"Edge{i + 1}" for i in edge_color_map]
@@ -125,7 +124,7 @@ class DFMViewProvider:
         if face_index is None:
             return
 
-        face = self.target_object.Shape.Faces[face_index]
+        face = self._shape_faces[face_index]
         base_pos = self._find_on_surface_point(face)
         self._place_annotation(base_pos, text, color_hex)
 
@@ -139,7 +138,7 @@ class DFMViewProvider:
         if edge_index is None:
             return
 
-        edge = self.target_object.Shape.Edges[edge_index]
+        edge = self._shape_edges[edge_index]
         try:
             mid = edge.FirstParameter + (edge.LastParameter - edge.FirstParameter) * 0.5
             base_pos = edge.valueAt(mid)
@@ -172,7 +171,7 @@ class DFMViewProvider:
         if overlay is None:
             overlay = doc.addObject("Part::Feature", self.OVERLAY_NAME)  # type: ignore
 
-        overlay.Shape = self.target_object.Shape.copy()
+        overlay.Shape = self._shape.copy()
         self.target_object.ViewObject.Visibility = False
 
         vo = overlay.ViewObject
@@ -189,13 +188,13 @@ class DFMViewProvider:
             r, g, b = (int(h[i : i + 2], 16) / 255 for i in (0, 2, 4))
             return (r, g, b, 0.0)
 
-        num_faces = len(self.target_object.Shape.Faces)
+        num_faces = len(self._shape_faces)
         face_colors = [
             hex_to_rgba(face_color_map[i]) if i in face_color_map else self.OVERLAY_INACTIVE_COLOR
             for i in range(num_faces)
         ]
 
-        num_edges = len(self.target_object.Shape.Edges)
+        num_edges = len(self._shape_edges)
         edge_colors = [
             hex_to_rgba(edge_color_map[i]) if i in edge_color_map else self.OVERLAY_INACTIVE_COLOR
             for i in range(num_edges)
@@ -2,8 +2,6 @@
 # SPDX-FileCopyrightText: 2025 Ryan Kembrey <ryan.FreeCAD@gmail.com>
 # SPDX-FileNotice: Part of the DFM addon.
 
-from collections import defaultdict
-
 from ...core.processes.process import Process
 from ...core.models import CheckResult, Severity
 
@@ -22,30 +20,64 @@ class DFMReportModel:
         self.process = process
         self.material = material
 
+        # Grouping is memoized; ignore toggles drop the cache since they
+        # change both the intra-group and the rule ordering.
+        self._grouped_cache: dict | None = None
+
+        # Verdict counters are maintained incrementally by
+        # toggle_ignore_state so get_verdict never rescans the results.
+        self._active_errors = 0
+        self._active_warnings = 0
+        for r in results:
+            if r.ignore:
+                continue
+            if r.severity is Severity.ERROR:
+                self._active_errors += 1
+            elif r.severity is Severity.WARNING:
+                self._active_warnings += 1
+
     @property
     def active_results(self):
         return [r for r in self.results if not r.ignore]
 
     def get_grouped_results(self) -> dict:
-        grouped = defaultdict(list)
+        if self._grouped_cache is not None:
+            return self._grouped_cache
+
+        # Group and accumulate the per-rule sort inputs (active count, worst
+        # severity) in the same pass instead of re-scanning each group later.
+        grouped: dict = {}
+        active_count: dict = {}
+        worst_severity: dict = {}
+
         for result in self.results:
-            grouped[result.rule_id].append(result)
-        for rule_id in grouped:
-            grouped[rule_id].sort(key=lambda x: (x.ignore, -x.severity.value))
+            rule_id = result.rule_id
+            findings = grouped.get(rule_id)
+            if findings is None:
+                findings = grouped[rule_id] = []
+                active_count[rule_id] = 0
+                worst_severity[rule_id] = 0
+            findings.append(result)
+            if not result.ignore:
+                active_count[rule_id] += 1
+                if result.severity_rank > worst_severity[rule_id]:
+                    worst_severity[rule_id] = result.severity_rank
+
+        for findings in grouped.values():
+            findings.sort(key=lambda x: (x.ignore, -x.severity_rank))
 
         def rule_sort_key(item):
-            rule_id, findings = item
-            active = [f for f in findings if not f.ignore]
-            if not active:
+            rule_id, _findings = item
+            if not active_count[rule_id]:
                 return (2, 0, rule_id.label)
-            worst = max(f.severity.value for f in active)
-            return (2 - worst, -len(active), rule_id.label)
+            return (2 - worst_severity[rule_id], -active_count[rule_id], rule_id.label)
 
-        return dict(sorted(grouped.items(), key=rule_sort_key))
+        self._grouped_cache = dict(sorted(grouped.items(), key=rule_sort_key))
+        return self._grouped_cache
 
     def get_verdict(self) -> tuple[str, str]:
-        errors = sum(1 for r in self.active_results if r.severity == Severity.ERROR)
-        warnings = sum(1 for r in self.active_results if r.severity == Severity.WARNING)
+        errors = self._active_errors
+        warnings = self._active_warnings
 
         parts = []
         if errors:
@@ -65,3 +97,10 @@ class DFMReportModel:
 
     def toggle_ignore_state(self, finding: CheckResult):
         finding.ignore = not finding.ignore
+        self._grouped_cache = None
+
+        delta = -1 if finding.ignore else 1
+        if finding.severity is Severity.ERROR:
+            self._active_errors += delta
+        elif finding.severity is Severity.WARNING:
+            self._active_warnings += delta
@@ -51,6 +51,9 @@ class TaskResultsPresenter:
         self.history_manager = history_manager
         self.doc_name = doc_name
         self.shape_name = shape_name
+        self._icon_cache: dict[str, QtGui.QIcon] = {}
+        self._icon_html_cache: dict[Severity, str] = {}
+        self._detail_html_cache: dict[int, str] = {}
 
         self.build_history_tab()
 
@@ -67,9 +70,7 @@ class TaskResultsPresenter:
         self.view.form.leProcess.setCursorPosition(0)
         self.view.form.leMaterial.setCursorPosition(0)
 
-        text, color = self.model.get_verdict()
-        self.view.form.leVerdict.setText(text)
-        self.view.form.leVerdict.setStyleSheet(f"color: {color}; font-weight: bold;")
+        self._refresh_verdict()
 
         self.view.render_tree(
             self.model.get_grouped_results(),
@@ -86,12 +87,35 @@ class TaskResultsPresenter:
             )
             self.view.adjust_details_height()
 
+    def _icon(self, path: str) -> QtGui.QIcon:
+        """Returns a resource icon, constructed once per path."""
+        icon = self._icon_cache.get(path)
+        if icon is None:
+            icon = self._icon_cache[path] = QtGui.QIcon(path)
+        return icon
+
+    def _icon_html(self, severity: Severity) -> str:
+        """Returns the inline <img> tag for a severity icon.
+
+        icon_to_html renders a pixmap and base64-encodes a PNG, so the
+        result is cached per severity instead of being rebuilt per click."""
+        cached = self._icon_html_cache.get(severity)
+        if cached is None:
+            icon = self.view._get_icon(severity)
+            cached = self._icon_html_cache[severity] = icon_to_html(icon, size=16)
+        return cached
+
+    def _refresh_verdict(self):
+        text, color = self.model.get_verdict()
+        self.view.form.leVerdict.setText(text)
+        self.view.form.leVerdict.setStyleSheet(f"color: {color}; font-weight: bold;")
+
     def handle_selection(self, data: CheckResult | list[CheckResult]):
-        Gui.Selection.clearSelection()
+        # The bridge clears the selection itself before re-highlighting, so
+        # clearing here too would issue two C++ selection updates per click.
         if isinstance(data, list) and len(data) == 0:
             self.bridge.highlight_faces_and_edges_by_index([], [])
-            icon = self.view._get_icon(Severity.SUCCESS)
-            icon_html = icon_to_html(icon, size=16)
+            icon_html = self._icon_html(Severity.SUCCESS)
             self.view.form.tbDetails.setHtml(
                 f"<table cellspacing='0' cellpadding='0'><tr>"
                 f"<td valign='middle' style='padding-right:4px'>{icon_html}</td>"
@@ -112,8 +136,7 @@ class TaskResultsPresenter:
             worst_severity = max(
                 (r.severity for r in active), key=lambda s: s.value, default=Severity.SUCCESS
             )
-            icon = self.view._get_icon(worst_severity)
-            icon_html = icon_to_html(icon, size=16)
+            icon_html = self._icon_html(worst_severity)
 
             self.view.form.tbDetails.setHtml(
                 f"<table cellspacing='0' cellpadding='0'><tr>"
@@ -140,17 +163,21 @@ class TaskResultsPresenter:
             self.bridge.highlight_faces_and_edges_by_index(face_pairs, edge_pairs)
 
         elif isinstance(data, CheckResult):
-            overview = html.escape(data.overview)
             color = severity_color(data.severity)
-            icon = self.view._get_icon(data.severity)
-            icon_html = icon_to_html(icon, size=16)
-            self.view.form.tbDetails.setHtml(
-                f"<table cellspacing='0' cellpadding='0'><tr>"
-                f"<td valign='middle' style='padding-right:4px'>{icon_html}</td>"
-                f"<td valign='middle'><b>{overview}</b></td>"
-                f"</tr></table>"
-                f"<p style='margin-top:4px'>{data.message}</p>"
-            )
+            # Escaping and formatting the detail block is pure function of
+            # the finding, so it is built once per finding and reused.
+            detail_html = self._detail_html_cache.get(id(data))
+            if detail_html is None:
+                overview = html.escape(data.overview)
+                icon_html = self._icon_html(data.severity)
+                detail_html = self._detail_html_cache[id(data)] = (
+                    f"<table cellspacing='0' cellpadding='0'><tr>"
+                    f"<td valign='middle' style='padding-right:4px'>{icon_html}</td>"
+                    f"<td valign='middle'><b>{overview}</b></td>"
+                    f"</tr></table>"
+                    f"<p style='margin-top:4px'>{data.message}</p>"
+                )
+            self.view.form.tbDetails.setHtml(detail_html)
 
             face_refs = [ref for ref in data.refs if ref.type == "Face"]
             edge_refs = [ref for ref in data.refs if ref.type == "Edge"]
@@ -195,7 +222,12 @@ class TaskResultsPresenter:
 
     def handle_ignore(self, result: CheckResult):
         self.model.toggle_ignore_state(result)
-        self.refresh_ui()
+        # A single toggle only dirties one row and its ancestors; mutate them
+        # in place and fall back to a full rebuild only if the row is missing.
+        if self.view.update_finding_item(result):
+            self._refresh_verdict()
+        else:
+            self.refresh_ui()
 
     def handle_export(self):
         path, _ = QFileDialog.getSaveFileName(
@@ -366,7 +398,7 @@ class TaskResultsPresenter:
             to_text, to_color = _pill(d.current_errors, d.current_warnings, d.current_success)
 
             item = QtWidgets.QListWidgetItem()
-            item.setIcon(QtGui.QIcon(icon_path))
+            item.setIcon(self._icon(icon_path))
             item.setData(QtCore.Qt.ItemDataRole.UserRole + 1, "diff")
             item.setData(QtCore.Qt.ItemDataRole.UserRole + 2, d.rule_label)
             item.setData(QtCore.Qt.ItemDataRole.UserRole + 3, from_text)
@@ -15,6 +15,11 @@ from ...gui.results.models import DFMReportModel
 from ...core.rules import Criticality
 
 
+# Registered once so every export shares the same explicit quoting and line
+# endings instead of re-deriving them from the default dialect per writer.
+csv.register_dialect("dfm", quoting=csv.QUOTE_MINIMAL, lineterminator="\n")
+
+
 @dataclass
 class CSVExportConfig:
     include_criticality: bool = True
@@ -44,16 +49,16 @@ class CSVResultExporter:
         get_criticality: Optional[Callable] = None,
     ) -> bool:
         try:
-            with open(filepath, mode="w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f, delimiter=config.delimiter)
+            with open(filepath, mode="w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+                writer = csv.writer(f, dialect="dfm", delimiter=config.delimiter)
 
                 if config.include_metadata:
                     verdict_text, _ = model.get_verdict()
-                    writer.writerow(["Design", target_label])
-                    writer.writerow(["Process", model.process.name])
-                    writer.writerow(["Material", model.material])
-                    writer.writerow(["Verdict", verdict_text])
-                    writer.writerow([])
+                    writer.writerow(("Design", target_label))
+                    writer.writerow(("Process", model.process.name))
+                    writer.writerow(("Material", model.material))
+                    writer.writerow(("Verdict", verdict_text))
+                    writer.writerow(())
 
                 headers = ["Status", "Rule"]
                 if config.include_criticality:
@@ -73,6 +78,10 @@ class CSVResultExporter:
                         return get_criticality(rule_id).value
                     return Criticality.MEDIUM.value
 
+                # Collect all data rows first and hand them to the C csv
+                # writer in one writerows call instead of crossing the
+                # Python/C boundary once per finding.
+                rows = []
                 for rule_id, findings in sorted(grouped.items(), key=_crit_sort):
                     criticality_label = ""
                     if config.include_criticality and get_criticality:
@@ -112,11 +121,10 @@ class CSVResultExporter:
                         if config.include_feedback:
                             row.append(msg)
 
-                        writer.writerow(row)
+                        rows.append(tuple(row))
 
                 if config.include_passed:
-                    grouped_rule_ids = set(grouped.keys())
-                    passed = [r for r in model.process.active_rules if r not in grouped_rule_ids]
+                    passed = [r for r in model.process.active_rules if r not in grouped]
                     for rule in passed:
                         row = ["PASS", rule.label]
                         if config.include_criticality:
@@ -127,7 +135,9 @@ class CSVResultExporter:
                             row.append("")
                         if config.include_feedback:
                             row.append("")
-                        writer.writerow(row)
+                        rows.append(tuple(row))
+
+                writer.writerows(rows)
 
             return True
 
@@ -43,6 +43,13 @@ class TaskResults(QtCore.QObject):
         )
 
         self._save_clicked = False
+        self._icon_cache: dict[Severity, QtGui.QIcon] = {}
+        self._item_by_finding: dict[int, QStandardItem] = {}
+
+        self._details_resize_timer = QtCore.QTimer(self.form)
+        self._details_resize_timer.setSingleShot(True)
+        self._details_resize_timer.setInterval(0)
+        self._details_resize_timer.timeout.connect(self._do_adjust_details_height)
 
         self.on_closed: Callable[[], None] | None = None
         self.on_row_selected: Callable[[CheckResult | list[CheckResult]], None] | None = None
@@ -70,12 +77,34 @@ class TaskResults(QtCore.QObject):
             self.adjust_details_height()
 
     def adjust_details_height(self):
+        """Schedules a resize of the description box.
+
+        Sizing forces a QTextBrowser re-layout, so bursts of calls (e.g.
+        arrow-key navigation) are coalesced into one resize per event-loop
+        turn via a zero-interval single-shot timer."""
+        self._details_resize_timer.start()
+
+    def _do_adjust_details_height(self):
         """Dynamic resizing of the description box based on content."""
         doc = self.form.tbDetails.document()
         content_height = doc.documentLayout().documentSize().height()
         final_height = int(content_height) + 10
         self.form.tbDetails.setFixedHeight(max(60, min(final_height, 300)))
 
+    @staticmethod
+    def _count_active(findings) -> tuple[int, int, int]:
+        """Counts non-ignored errors, warnings, and findings in one pass."""
+        errors = warnings = active = 0
+        for f in findings:
+            if f.ignore:
+                continue
+            active += 1
+            if f.severity is Severity.ERROR:
+                errors += 1
+            elif f.severity is Severity.WARNING:
+                warnings += 1
+        return errors, warnings, active
+
     def render_tree(self, grouped_data: dict, all_process_rules: list, get_criticality=None):
         expanded_labels = set()
 
@@ -88,14 +117,19 @@ class TaskResults(QtCore.QObject):
 
         _collect_expanded(self.model.invisibleRootItem())
 
+        self._item_by_finding.clear()
         self.model.clear()
         self.form.tvResults.setItemDelegate(DFMTreeDelegate())
         root = self.model.invisibleRootItem()
 
+        # Hoisted out of the per-finding loop: each Qt enum access is an
+        # attribute-chain lookup, which adds up over large result sets.
+        user_role = QtCore.Qt.ItemDataRole.UserRole
+        get_icon = self._get_icon
+        get_color = severity_color
+
         all_findings_full = [f for findings in grouped_data.values() for f in findings]
-        all_findings_active = [f for f in all_findings_full if not f.ignore]
-        total_errors = sum(1 for f in all_findings_active if f.severity == Severity.ERROR)
-        total_warnings = sum(1 for f in all_findings_active if f.severity == Severity.WARNING)
+        total_errors, total_warnings, _ = self._count_active(all_findings_full)
 
         all_item = QStandardItem()
         all_item.setEditable(False)
@@ -128,9 +162,7 @@ class TaskResults(QtCore.QObject):
         for criticality in sorted(crit_groups, key=lambda c: c.value):
             rules = crit_groups[criticality]
             group_findings_full = [f for _, findings in rules for f in findings]
-            group_findings_active = [f for f in group_findings_full if not f.ignore]
-            g_errors = sum(1 for f in group_findings_active if f.severity == Severity.ERROR)
-            g_warnings = sum(1 for f in group_findings_active if f.severity == Severity.WARNING)
+            g_errors, g_warnings, _ = self._count_active(group_findings_full)
 
             crit_item = QStandardItem()
             crit_item.setEditable(False)
@@ -153,14 +185,9 @@ class TaskResults(QtCore.QObject):
             )
             all_item.appendRow(crit_item)
 
+            rule_items = []
             for rule_id, findings in rules:
-                error_count = sum(
-                    1 for f in findings if not f.ignore and f.severity == Severity.ERROR
-                )
-                warning_count = sum(
-                    1 for f in findings if not f.ignore and f.severity == Severity.WARNING
-                )
-                active_count = sum(1 for f in findings if not f.ignore)
+                error_count, warning_count, active_count = self._count_active(findings)
                 all_ignored = active_count == 0
                 severity = findings[0].severity
                 color = "#639922" if all_ignored else severity_color(severity)
@@ -178,22 +205,26 @@ class TaskResults(QtCore.QObject):
                     self._get_icon(Severity.SUCCESS) if all_ignored else self._get_icon(severity)
                 )
 
+                children = []
                 for finding in findings:
                     name = finding.refs[0].label if finding.refs else "Unknown"
                     child = QStandardItem()
                     child.setEditable(False)
-                    child.setData(finding, QtCore.Qt.ItemDataRole.UserRole)
-                    child.setData("finding", QtCore.Qt.ItemDataRole.UserRole + 1)
-                    child.setData(name, QtCore.Qt.ItemDataRole.UserRole + 2)
-                    child.setData(finding.overview, QtCore.Qt.ItemDataRole.UserRole + 3)
-                    child.setData(
-                        severity_color(finding.severity), QtCore.Qt.ItemDataRole.UserRole + 4
-                    )
-                    child.setData(finding.ignore, QtCore.Qt.ItemDataRole.UserRole + 5)
-                    child.setIcon(self._get_icon(finding.severity))
-                    rule_item.appendRow(child)
-
-                crit_item.appendRow(rule_item)
+                    child.setData(finding, user_role)
+                    child.setData("finding", user_role + 1)
+                    child.setData(name, user_role + 2)
+                    child.setData(finding.overview, user_role + 3)
+                    child.setData(get_color(finding.severity), user_role + 4)
+                    child.setData(finding.ignore, user_role + 5)
+                    child.setIcon(get_icon(finding.severity))
+                    self._item_by_finding[id(finding)] = child
+                    children.append(child)
+
+                rule_item.appendRows(children)
+                rule_items.append((rule_id, rule_item))
+
+            crit_item.appendRows([item for _, item in rule_items])
+            for rule_id, rule_item in rule_items:
                 if rule_id.label in expanded_labels:
                     self.form.tvResults.setExpanded(self.model.indexFromItem(rule_item), True)
 
@@ -214,23 +245,70 @@ class TaskResults(QtCore.QObject):
             passed_item.setIcon(self._get_icon(Severity.SUCCESS))
             root.appendRow(passed_item)
 
+            pass_items = []
             for rule in passed_rules:
                 pass_item = QStandardItem()
                 pass_item.setEditable(False)
-                pass_item.setData([], QtCore.Qt.ItemDataRole.UserRole)
-                pass_item.setData("rule", QtCore.Qt.ItemDataRole.UserRole + 1)
-                pass_item.setData(rule.label, QtCore.Qt.ItemDataRole.UserRole + 2)
-                pass_item.setData("0", QtCore.Qt.ItemDataRole.UserRole + 3)
-                pass_item.setData("#639922", QtCore.Qt.ItemDataRole.UserRole + 4)
-                pass_item.setData(0, QtCore.Qt.ItemDataRole.UserRole + 6)
-                pass_item.setData(0, QtCore.Qt.ItemDataRole.UserRole + 7)
-                pass_item.setIcon(QtGui.QIcon(":/icons/dfm_success.svg"))
-                passed_item.appendRow(pass_item)
+                pass_item.setData([], user_role)
+                pass_item.setData("rule", user_role + 1)
+                pass_item.setData(rule.label, user_role + 2)
+                pass_item.setData("0", user_role + 3)
+                pass_item.setData("#639922", user_role + 4)
+                pass_item.setData(0, user_role + 6)
+                pass_item.setData(0, user_role + 7)
+                pass_item.setIcon(get_icon(Severity.SUCCESS))
+                pass_items.append(pass_item)
+            passed_item.appendRows(pass_items)
 
         self.form.tvResults.setCurrentIndex(self.model.index(0, 0))
         self.form.tvResults.expand(self.model.index(0, 0))
         self.form.tvResults.setFocus()
 
+    def update_finding_item(self, finding: CheckResult) -> bool:
+        """Refreshes one toggled finding's row and its ancestor summaries in
+        place, avoiding a full tree rebuild.
+
+        Returns False if the finding has no row yet (tree not rendered)."""
+        item = self._item_by_finding.get(id(finding))
+        if item is None:
+            return False
+
+        item.setData(finding.ignore, QtCore.Qt.ItemDataRole.UserRole + 5)
+
+        parent = item.parent()
+        while parent is not None:
+            self._refresh_group_item(parent)
+            parent = parent.parent()
+        return True
+
+    def _refresh_group_item(self, item: QStandardItem):
+        """Recomputes the count, color, and icon roles of a group row."""
+        findings = item.data(QtCore.Qt.ItemDataRole.UserRole) or []
+        item_type = item.data(QtCore.Qt.ItemDataRole.UserRole + 1)
+
+        errors, warnings, active = self._count_active(findings)
+
+        if item_type == "rule":
+            all_ignored = active == 0
+            severity = findings[0].severity if findings else Severity.SUCCESS
+            color = "#639922" if all_ignored else severity_color(severity)
+            icon = self._get_icon(Severity.SUCCESS) if all_ignored else self._get_icon(severity)
+            item.setData(str(active), QtCore.Qt.ItemDataRole.UserRole + 3)
+        else:
+            color = "#E24B4A" if errors else "#D4900A" if warnings else "#639922"
+            icon = (
+                self._get_icon(Severity.ERROR)
+                if errors
+                else self._get_icon(Severity.WARNING)
+                if warnings
+                else self._get_icon(Severity.SUCCESS)
+            )
+
+        item.setData(color, QtCore.Qt.ItemDataRole.UserRole + 4)
+        item.setData(errors, QtCore.Qt.ItemDataRole.UserRole + 6)
+        item.setData(warnings, QtCore.Qt.ItemDataRole.UserRole + 7)
+        item.setIcon(icon)
+
     def get_export_config(self) -> CSVExportConfig:
         return CSVExportConfig(
             include_criticality=self.form.cbColCriticality.isChecked(),
@@ -246,15 +324,19 @@ class TaskResults(QtCore.QObject):
             ),
         )
 
+    ICON_PATHS = {
+        Severity.ERROR: ":/icons/dfm_error.svg",
+        Severity.WARNING: ":/icons/dfm_warning.svg",
+        Severity.INFO: ":/icons/dfm_info.svg",
+    }
+
     def _get_icon(self, severity: Severity) -> QtGui.QIcon:
-        """Returns a severity circle icon for the given severity level."""
-        icon_map = {
-            Severity.ERROR: ":/icons/dfm_error.svg",
-            Severity.WARNING: ":/icons/dfm_warning.svg",
-            Severity.INFO: ":/icons/dfm_info.svg",
-        }
-        path = icon_map.get(severity, ":/icons/dfm_success.svg")
-        return QtGui.QIcon(path)
+        """Returns a severity circle icon, built once per severity level."""
+        icon = self._icon_cache.get(severity)
+        if icon is None:
+            path = self.ICON_PATHS.get(severity, ":/icons/dfm_success.svg")
+            icon = self._icon_cache[severity] = QtGui.QIcon(path)
+        return icon
 
     def _handle_double_click(self, index: QtCore.QModelIndex):
         item = self.model.itemFromIndex(index)
@@ -320,6 +320,9 @@ class TaskSetup:
         self.form.setWindowIcon(QtGui.QIcon(":/icons/dfm_analysis.svg"))
 
         self.registry = ProcessRegistry.get_instance()
+        # One runner for the panel's lifetime, so repeat runs with different
+        # materials reuse the same orchestrator instead of rebuilding it.
+        self.runner = AnalysisRunner()
 
         self.target_object = None
         self.target_shape = None
@@ -350,13 +353,28 @@ class TaskSetup:
         self._update_run_button_state()
 
     def _setup_widgets(self):
+        # A QListView popup with uniform item sizes lays out only the visible
+        # rows, which keeps large process/material catalogs from stalling the
+        # first popup open.
+        for cb in (self.form.cbManCategory, self.form.cbManProcess, self.form.cbMaterial):
+            view = QtWidgets.QListView(cb)
+            view.setUniformItemSizes(True)
+            view.setLayoutMode(QtWidgets.QListView.LayoutMode.Batched)
+            view.setBatchSize(64)
+            cb.setView(view)
+
         self.form.cbManCategory.setPlaceholderText("Select a category")
         self.form.cbManCategory.setCurrentIndex(-1)
 
         self.form.cbManProcess.setPlaceholderText("Select a category first")
         self.form.cbManProcess.setEnabled(False)
 
-        self.form.cbMaterial.setPlaceholderText("Select a process first")
+        # Editable with a filtering completer, so large material catalogs are
+        # narrowed by typing instead of scrolled; NoInsert keeps typed text
+        # from becoming a phantom item.
+        self.form.cbMaterial.setEditable(True)
+        self.form.cbMaterial.setInsertPolicy(QtWidgets.QComboBox.InsertPolicy.NoInsert)
+        self._set_material_placeholder("Select a process first")
         self.form.cbMaterial.setEnabled(False)
 
         self.form.leSelectModel.setReadOnly(True)
@@ -373,10 +391,21 @@ class TaskSetup:
             layout = QtWidgets.QVBoxLayout(self.form.gbOptions)
             self.form.gbOptions.setLayout(layout)
 
+    def _set_material_placeholder(self, text: str):
+        """Keeps the combo and its line edit placeholder in sync (editable
+        comboboxes show the line edit's placeholder, not their own)."""
+        self.form.cbMaterial.setPlaceholderText(text)
+        line_edit = self.form.cbMaterial.lineEdit()
+        if line_edit is not None:
+            line_edit.setPlaceholderText(text)
+
     def _populate_categories(self):
         self.form.cbManCategory.blockSignals(True)
         self.form.cbManCategory.clear()
-        self.form.cbManCategory.addItems(self.registry.get_categories())
+        # The key is stored as item data so the change handler reads it back
+        # with currentData() instead of converting the QString display text.
+        for category in self.registry.get_categories():
+            self.form.cbManCategory.addItem(category, userData=category)
         self.form.cbManCategory.setCurrentIndex(-1)
         self.form.cbManCategory.blockSignals(False)
 
@@ -387,6 +416,7 @@ class TaskSetup:
         self.form.cbManCategory.currentIndexChanged.connect(self.on_category_changed)
         self.form.cbManProcess.currentIndexChanged.connect(self.on_process_changed)
         self.form.cbMaterial.currentIndexChanged.connect(self._update_run_button_state)
+        self.form.cbMaterial.editTextChanged.connect(self._update_run_button_state)
 
     def _on_escape(self) -> bool:
         """Cancel picking mode on Escape. Returns True if handled."""
@@ -450,9 +480,12 @@ class TaskSetup:
         else:
             self._toggle_pick_mode_model()
 
-    def _apply_model_selection(self) -> bool:
+    def _apply_model_selection(self, sel=None) -> bool:
         try:
-            sel = Gui.Selection.getSelection()
+            # Each getSelection() call materializes a list from the C++
+            # selection manager, so callers that already hold one pass it in.
+            if sel is None:
+                sel = Gui.Selection.getSelection()
             if not sel:
                 return False
             self.target_object = sel[0]
@@ -484,8 +517,9 @@ class TaskSetup:
         self.cursor_overridden = True
 
     def _auto_select_model(self):
-        if len(Gui.Selection.getSelection()) > 0:
-            if self._apply_model_selection():
+        sel = Gui.Selection.getSelection()
+        if sel:
+            if self._apply_model_selection(sel):
                 assert self.target_object is not None
                 Gui.Selection.clearSelection()
                 App.Console.PrintMessage(f"DFM: auto-selected {self.target_object.Label}\n")
@@ -495,7 +529,7 @@ class TaskSetup:
             handler.remove_indicator()
 
     def on_category_changed(self):
-        selected_category = self.form.cbManCategory.currentText()
+        selected_category = self.form.cbManCategory.currentData()
 
         self.form.cbManProcess.blockSignals(True)
         self.form.cbManProcess.clear()
@@ -522,22 +556,25 @@ class TaskSetup:
         if not process_id:
             self.process = None
             self.form.cbMaterial.setEnabled(False)
-            self.form.cbMaterial.setPlaceholderText("Select a process first")
+            self._set_material_placeholder("Select a process first")
             self.form.cbMaterial.setCurrentIndex(-1)
             self.form.cbMaterial.blockSignals(False)
             self._update_options_visibility()
             self._update_run_button_state()
             return
 
-        self.process = self.registry.get_process_by_id(process_id)
-        materials = list(self.process.materials.keys())
+        self.process, materials = self.registry.get_process_materials(process_id)
         if materials:
             self.form.cbMaterial.addItems(materials)
+            completer = QtWidgets.QCompleter(list(materials), self.form.cbMaterial)
+            completer.setFilterMode(QtCore.Qt.MatchFlag.MatchContains)
+            completer.setCaseSensitivity(QtCore.Qt.CaseSensitivity.CaseInsensitive)
+            self.form.cbMaterial.setCompleter(completer)
             self.form.cbMaterial.setEnabled(True)
-            self.form.cbMaterial.setPlaceholderText("Select a material")
+            self._set_material_placeholder("Select a material")
         else:
             self.form.cbMaterial.setEnabled(False)
-            self.form.cbMaterial.setPlaceholderText("No materials defined")
+            self._set_material_placeholder("No materials defined")
         self.form.cbMaterial.setCurrentIndex(-1)
         self.form.cbMaterial.blockSignals(False)
 
@@ -595,21 +632,11 @@ class TaskSetup:
         self.form.gbOptions.show()
 
     def get_active_requirements(self) -> set[ProcessRequirement]:
-        requirements = set()
+        requirements: set[ProcessRequirement] = set()
         if not self.process:
             return requirements
         for rule in self.process.active_rules:
-            try:
-                check_cls = get_check_class(rule)
-                if not check_cls:
-                    continue
-                analyzer_id = check_cls().required_analyzer_id
-                analyzer_cls = get_analyzer_class(analyzer_id)
-                if analyzer_cls:
-                    requirements.update(analyzer_cls().requirements)
-            except KeyError:
-                App.Console.PrintWarning(f"Rule '{rule.name}' not found in Rulebook.\n")
-                continue
+            requirements.update(_rule_requirements(rule))
         return requirements
 
     def _missing_requirements(self) -> list[str]:
@@ -618,7 +645,11 @@ class TaskSetup:
             missing.append("target model")
         if not self.process:
             missing.append("manufacturing process")
-        if self.form.cbMaterial.currentIndex() < 0:
+        cb_material = self.form.cbMaterial
+        # The combo is editable: currentIndex() keeps the last selection while
+        # the user edits the text, so the typed text must be checked against
+        # the actual entries or a nonexistent material could reach the runner.
+        if cb_material.currentIndex() < 0 or cb_material.findText(cb_material.currentText()) < 0:
             missing.append("material")
 
         if self.process:
@@ -709,8 +740,7 @@ class TaskSetup:
 
         process_name = self.form.cbManProcess.currentData()
         material_name = self.form.cbMaterial.currentText()
-        runner = AnalysisRunner()
-        return runner.run_analysis(
+        return self.runner.run_analysis(
             process_name=process_name,
             material_name=material_name,
             shape=self.target_shape,
@@ -805,10 +835,38 @@ class TaskSetup:
 # =============================================================================
 
 
+_RULE_REQUIREMENTS_CACHE: dict = {}
+
+
+def _rule_requirements(rule) -> frozenset[ProcessRequirement]:
+    """Requirements of a rule's analyzer, resolved once per rule.
+
+    The check/analyzer wiring is static, so the class instantiations needed
+    to read it are not repeated every time the run button re-validates."""
+    cached = _RULE_REQUIREMENTS_CACHE.get(rule)
+    if cached is not None:
+        return cached
+
+    requirements: frozenset[ProcessRequirement] = frozenset()
+    try:
+        check_cls = get_check_class(rule)
+        if check_cls:
+            analyzer_cls = get_analyzer_class(check_cls().required_analyzer_id)
+            if analyzer_cls:
+                requirements = frozenset(analyzer_cls().requirements)
+    except KeyError:
+        App.Console.PrintWarning(f"Rule '{rule.name}' not found in Rulebook.\n")
+
+    _RULE_REQUIREMENTS_CACHE[rule] = requirements
+    return requirements
+
+
 def _resolve_geometry_refs(results: list[CheckResult]) -> None:
     for result in results:
+        # Dedupe on the (kind, index) key itself; identity-based set() would
+        # not collapse equal geometry if wrappers ever reappear here.
         resolved = []
-        for kind, index in result.failing_geometry:
+        for kind, index in dict.fromkeys(result.failing_geometry):
             resolved.append(GeometryRef(type=kind, index=index - 1, label=f"{kind}{index}"))
         result.refs = resolved
         result.failing_geometry = []
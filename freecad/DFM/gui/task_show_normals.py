@@ -4,16 +4,6 @@
 
 import FreeCAD  # type: ignore
 import FreeCADGui as Gui  # type: ignore
-import Part  # type: ignore
-
-from OCP.TopExp import TopExp_Explorer
-from OCP.TopAbs import TopAbs_FACE, TopAbs_REVERSED
-from OCP.BRep import BRep_Tool
-from OCP.GeomLProp import GeomLProp_SLProps
-from OCP.TopoDS import TopoDS
-
-from ..core.utils.geometry import get_face_uv_center
-from ..core.utils.conversion import freecad_to_ocp
 
 
 class TaskShowNormals:
@@ -25,16 +15,41 @@ class TaskShowNormals:
         Creates an object in the tree showing the
         calculated normal for every face on the target object.
         """
-        shape = freecad_to_ocp(doc_object.Shape)
-        explorer = TopExp_Explorer(shape, TopAbs_FACE)  # type: ignore
+        # Imported on first use: this module loads at workbench startup just
+        # to register its command, and the debug overlay is rarely invoked.
+        import numpy as np
 
-        debug_lines = []
+        from OCP.TopAbs import TopAbs_REVERSED
+        from OCP.BRep import BRep_Builder, BRep_Tool
+        from OCP.BRepBuilderAPI import BRepBuilderAPI_MakeEdge
+        from OCP.BRepTools import BRepTools
+        from OCP.GeomLProp import GeomLProp_SLProps
+        from OCP.TopoDS import TopoDS_Compound
+        from OCP.gp import gp_Pnt
 
-        while explorer.More():
-            face = TopoDS.Face_s(explorer.Current())
+        from ..core.utils.conversion import freecad_to_ocp, ocp_to_freecad
+        from ..core.utils.geometry import FaceIndex
 
-            u, v = get_face_uv_center(face)
+        shape = freecad_to_ocp(doc_object.Shape)
 
+        # Edges go straight into one OCP compound instead of a Part.makeLine
+        # per face followed by a makeCompound copy.
+        builder = BRep_Builder()
+        comp = TopoDS_Compound()
+        builder.MakeCompound(comp)
+        num_lines = 0
+
+        # UV midpoints are computed for all faces in one vectorized pass
+        # rather than with per-face Python arithmetic.
+        faces = list(FaceIndex(shape))
+        uv_mid = np.empty((0, 2))
+        if faces:
+            uv_bounds = np.empty((len(faces), 4), dtype=np.float64)
+            for i, face in enumerate(faces):
+                uv_bounds[i] = BRepTools.UVBounds_s(face)
+            uv_mid = 0.5 * (uv_bounds[:, [0, 2]] + uv_bounds[:, [1, 3]])
+
+        for face, (u, v) in zip(faces, uv_mid):
             surface = BRep_Tool.Surface_s(face)
             props = GeomLProp_SLProps(surface, u, v, 1, 1e-6)
 
@@ -42,33 +57,33 @@ class TaskShowNormals:
                 pnt = props.Value()
                 norm = props.Normal()
 
-                if not face.Location().IsIdentity():
-                    pnt.Transform(face.Location().Transformation())
-                    norm.Transform(face.Location().Transformation())
+                # Location()/Transformation() construct transient wrappers, so
+                # they are fetched once per face rather than per use.
+                location = face.Location()
+                if not location.IsIdentity():
+                    trsf = location.Transformation()
+                    pnt.Transform(trsf)
+                    norm.Transform(trsf)
 
                 if face.Orientation() == TopAbs_REVERSED:
                     norm.Reverse()
 
-                v1 = FreeCAD.Vector(pnt.X(), pnt.Y(), pnt.Z())
-                v2 = FreeCAD.Vector(
+                tip = gp_Pnt(
                     pnt.X() + norm.X() * length,
                     pnt.Y() + norm.Y() * length,
                     pnt.Z() + norm.Z() * length,
                 )
 
-                line = Part.makeLine(v1, v2)
-                debug_lines.append(line)
-
-            explorer.Next()
+                builder.Add(comp, BRepBuilderAPI_MakeEdge(pnt, tip).Edge())
+                num_lines += 1
 
-        if debug_lines:
-            comp = Part.makeCompound(debug_lines)
+        if num_lines:
             obj = FreeCAD.ActiveDocument.addObject("Part::Feature", "Debug_Normals")
-            obj.Shape = comp
+            obj.Shape = ocp_to_freecad(comp)
             obj.ViewObject.ShapeColor = (1.0, 0.0, 0.0)
             obj.ViewObject.LineWidth = 2.0
             FreeCAD.ActiveDocument.recompute()
-            print(f"Created debug object with {len(debug_lines)} normals.")
+            print(f"Created debug object with {num_lines} normals.")
         else:
             print("No faces found.")
 